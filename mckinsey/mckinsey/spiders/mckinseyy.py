@@ -1,16 +1,49 @@
 import scrapy
 import random
+from mckinsey.items import MckinseyItem
 
 class McKinseySpider(scrapy.Spider):
     name = 'mckinseyy'
     allowed_domains = ['mckinsey.com']
     start_urls = ['https://www.mckinsey.com/search?q=bank+ai']
 
+    # Any article-like element, matched in a single DOM walk
+    _ARTICLE_XPATH = ("//*[contains(@class, 'article') or contains(@class, 'result') "
+                      "or contains(@class, 'item')]")
+    # ::text must be attached to every alternative, not just the last one
+    _TITLE_CSS = 'h1::text, h2::text, h3::text, h4::text'
+
     custom_settings = {
         'ROBOTSTXT_OBEY': False,  # Disable robots.txt checking
         'DOWNLOAD_TIMEOUT': 30,   # Set timeout to 30 seconds
-        'DOWNLOAD_DELAY': 2,      # Add delay between requests
-        'CONCURRENT_REQUESTS': 1, # Be polite
+        'DOWNLOAD_DELAY': 0,      # AutoThrottle paces requests instead
+        'RANDOMIZE_DOWNLOAD_DELAY': True,  # Avoid request bursts
+        'CONCURRENT_REQUESTS': 16,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 8,
+        'AUTOTHROTTLE_ENABLED': True,  # Adapt delay to observed latency
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 4.0,
+        'AUTOTHROTTLE_START_DELAY': 1,
+        'AUTOTHROTTLE_MAX_DELAY': 10,
+        'REACTOR_THREADPOOL_MAXSIZE': 20,  # DNS lookups run in this pool
+        # Lean stack: single-domain scrape, no session state needed
+        'TELNETCONSOLE_ENABLED': False,
+        'COOKIES_ENABLED': False,
+        'SPIDER_MIDDLEWARES': {
+            'scrapy.spidermiddlewares.referer.RefererMiddleware': None,
+        },
+        'DOWNLOADER_MIDDLEWARES': {
+            'scrapy.downloadermiddlewares.offsite.OffsiteMiddleware': None,
+        },
+        'EXTENSIONS': {
+            'scrapy.extensions.telnet.TelnetConsole': None,
+            'scrapy.extensions.memusage.MemoryUsage': None,
+        },
+        # Replay pages from disk on reruns (stored under .scrapy/httpcache)
+        'HTTPCACHE_ENABLED': True,
+        'HTTPCACHE_EXPIRATION_SECS': 86400,
+        'HTTPCACHE_DIR': 'httpcache',
+        'HTTPCACHE_STORAGE': 'scrapy.extensions.httpcache.FilesystemCacheStorage',
+        'HTTPCACHE_POLICY': 'scrapy.extensions.httpcache.RFC2616Policy',
         'RETRY_TIMES': 2,         # Retry failed requests
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     }
@@ -33,11 +66,11 @@ class McKinseySpider(scrapy.Spider):
                 url = response.urljoin(url)
 
             if title and url:
-                yield {
-                    'title': title.strip(),
-                    'url': url,
-                    'description': item.css('p.description::text').get('').strip(),
-                }
+                yield MckinseyItem(
+                    title=title.strip(),
+                    url=url,
+                    description=item.css('p.description::text').get('').strip(),
+                )
                 results_found += 1
                 self.logger.info(f"Found: {title}")
 
@@ -51,23 +84,39 @@ class McKinseySpider(scrapy.Spider):
         """Try alternative CSS selectors if primary ones don't work"""
         self.logger.info("Trying alternative selectors...")
 
+        # Nested containers (e.g. .result > .item) match the same headline
+        # several times, so skip anything already yielded
+        seen = set()
+
         # Alternative 1: Look for any article-like elements
-        for article in response.css('[class*="article"], [class*="result"], [class*="item"]'):
-            title = article.css('h1, h2, h3, h4::text').get()
+        for article in response.xpath(self._ARTICLE_XPATH):
+            title = article.css(self._TITLE_CSS).get()
             link = article.css('a::attr(href)').get()
 
             if title and link:
                 if link and not link.startswith('http'):
                     link = response.urljoin(link)
 
-                yield {
-                    'title': title.strip(),
-                    'url': link,
-                    'description': article.css('p::text').get('').strip()[:100],  # First 100 chars
-                }
+                key = (title.strip(), link)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                yield MckinseyItem(
+                    title=title.strip(),
+                    url=link,
+                    description=article.css('p::text').get('').strip()[:100],  # First 100 chars
+                )
                 self.logger.info(f"Found with alternative selector: {title}")
 
-        # Save the page for debugging
-        with open('debug_page.html', 'w', encoding='utf-8') as f:
-            f.write(response.text)
-        self.logger.info("Saved page content to debug_page.html for inspection")
\ No newline at end of file
+        # Save the page for debugging (opt-in: scrapy crawl ... -s DEBUG_DUMP_HTML=1)
+        if self.settings.getbool('DEBUG_DUMP_HTML'):
+            from twisted.internet import reactor
+            # Write from a worker thread so the reactor keeps downloading
+            reactor.callInThread(self.dump_html, response.body)
+
+    def dump_html(self, body):
+        """Write raw page bytes to debug_page.html"""
+        with open('debug_page.html', 'wb') as f:
+            f.write(body)
+        self.logger.info("Saved page content to debug_page.html for inspection")
@@ -7,6 +7,9 @@ import scrapy
 
 
 class ScrappyBankinformItem(scrapy.Item):
-    # define the fields for your item here like:
-    # name = scrapy.Field()
-    pass
+    title = scrapy.Field()
+    url = scrapy.Field()
+    search_term = scrapy.Field()
+    description = scrapy.Field()
+    article_date = scrapy.Field()
+    scraped_at = scrapy.Field()
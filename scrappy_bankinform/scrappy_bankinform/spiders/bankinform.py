@@ -1,20 +1,154 @@
 import scrapy
 from urllib.parse import urljoin
 import re
+import logging
+from functools import lru_cache
 from datetime import datetime, timedelta
+from lxml import etree
+from scrappy_bankinform.items import ScrappyBankinformItem
+
+logger = logging.getLogger(__name__)
+
+# Precompiled patterns used by the date/text helpers
+_RU_DATE_RE = re.compile(r'(\d{1,2})\s+([а-яё]+)\s+(\d{4})')
+_DDMMYYYY_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')
+_YYYYMMDD_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+_RELATIVE_NUM_RE = re.compile(r'\d+')
+# Relative-date unit words ('час' also covers 'часа'/'часов') and their timedelta names
+_RELATIVE_UNIT_RE = re.compile(r'день|дня|дней|час|минут|недел')
+_RELATIVE_UNITS = {
+    'день': 'days', 'дня': 'days', 'дней': 'days',
+    'час': 'hours',
+    'минут': 'minutes',
+    'недел': 'weeks',
+}
+_WS_RE = re.compile(r'\s+')
+_ICON_TRANSLATE = str.maketrans('', '', '⏰🕒📅')
+
+# Check if it looks like a date
+_DATE_VALIDATE_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'\d{1,2}\s+[а-яё]+\s+\d{4}',
+    r'\d{1,2}\.\d{1,2}\.\d{4}',
+    r'\d{1,2}/\d{1,2}/\d{4}',
+    r'\d{4}-\d{1,2}-\d{1,2}',
+    r'\d{1,2}\s+[а-яё]+',
+    r'\d+\s+(час|день|дня|дней|минут|недел)'
+)]
+
+# Filter out unwanted content
+_UNWANTED_RE = re.compile(
+    r'подпишитесь|читайте также|реклама|advertisement|фото:|фотография:|источник:|по материалам',
+    re.IGNORECASE
+)
+
+_MONTH_MAPPING = {
+    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
+    'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
+    'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12
+}
+
+
+def _build_date(year, month, day, date_str):
+    """Build a datetime from already range-checked parts"""
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+
+    try:
+        return datetime(year, month, day)
+    except ValueError as e:
+        # Day is out of range for this particular month, e.g. 31 февраля
+        logger.warning(f"Failed to parse date '{date_str}': {e}")
+        return None
+
+
+def _parse_russian_date(date_str):
+    """
+    Parse Russian date format to datetime object
+    Handles formats like: '27 октября 2025'
+    """
+    # Use regex to extract date parts
+    match = _RU_DATE_RE.search(date_str)
+    if not match:
+        return None
+
+    month = _MONTH_MAPPING.get(match.group(2).lower())
+    if month is None:
+        return None
+
+    return _build_date(int(match.group(3)), month, int(match.group(1)), date_str)
+
+
+def _parse_standard_date(date_str):
+    """Parse standard date formats like DD.MM.YYYY"""
+    # Try DD.MM.YYYY
+    match = _DDMMYYYY_RE.search(date_str)
+    if match:
+        day, month, year = match.groups()
+    else:
+        # Try YYYY-MM-DD
+        match = _YYYYMMDD_RE.search(date_str)
+        if not match:
+            return None
+        year, month, day = match.groups()
+
+    return _build_date(int(year), int(month), int(day), date_str)
+
+
+@lru_cache(maxsize=2048)
+def _parse_date_cached(clean_text):
+    """Parse absolute dates; memoized since many articles share a date string"""
+    return _parse_russian_date(clean_text) or _parse_standard_date(clean_text)
+
 
 class BankinformSpider(scrapy.Spider):
     name = 'bankinform'
     allowed_domains = ['bankinform.ru']
 
+    # Compiled once at class load, evaluated directly on the lxml tree
+    _LINK_XPATH = etree.XPath(
+        "//a[contains(concat(' ', normalize-space(@class), ' '), ' text-decoration-none ')]")
+    _TITLE_XPATH = etree.XPath("string()", smart_strings=False)
+    _DATE_XPATH = etree.XPath(
+        '(./following-sibling::time[contains(@class, "date")] | '
+        '../time[contains(@class, "date")] | '
+        '../../time[contains(@class, "date")])[1]//text()', smart_strings=False)
+
     custom_settings = {
         'ROBOTSTXT_OBEY': False,
         'DOWNLOAD_TIMEOUT': 30,
-        'DOWNLOAD_DELAY': 2,
-        'CONCURRENT_REQUESTS': 1,
+        'DOWNLOAD_DELAY': 0,
+        'RANDOMIZE_DOWNLOAD_DELAY': True,
+        'CONCURRENT_REQUESTS': 16,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 8,
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 4.0,
+        'AUTOTHROTTLE_START_DELAY': 1,
+        'AUTOTHROTTLE_MAX_DELAY': 10,
+        'REACTOR_THREADPOOL_MAXSIZE': 20,
+        # Lean stack: clean_url already keeps us on bankinform.ru
+        'TELNETCONSOLE_ENABLED': False,
+        'COOKIES_ENABLED': False,
+        'SPIDER_MIDDLEWARES': {
+            'scrapy.spidermiddlewares.referer.RefererMiddleware': None,
+        },
+        'DOWNLOADER_MIDDLEWARES': {
+            'scrapy.downloadermiddlewares.offsite.OffsiteMiddleware': None,
+        },
+        'EXTENSIONS': {
+            'scrapy.extensions.telnet.TelnetConsole': None,
+            'scrapy.extensions.memusage.MemoryUsage': None,
+        },
+        # Replay pages from disk on reruns (stored under .scrapy/httpcache)
+        'HTTPCACHE_ENABLED': True,
+        'HTTPCACHE_EXPIRATION_SECS': 86400,
+        'HTTPCACHE_DIR': 'httpcache',
+        'HTTPCACHE_STORAGE': 'scrapy.extensions.httpcache.FilesystemCacheStorage',
+        'HTTPCACHE_POLICY': 'scrapy.extensions.httpcache.RFC2616Policy',
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'FEED_FORMAT': 'json',
-        'FEED_URI': 'file:///app/data/bankinform_articles_%(time)s.json',
+        # JSON Lines: each item is written as soon as it is scraped
+        'FEEDS': {
+            'file:///app/data/bankinform_articles_%(time)s.jsonl': {'format': 'jsonlines'},
+        },
     }
 
     def __init__(self, *args, **kwargs):
@@ -55,8 +189,12 @@ class BankinformSpider(scrapy.Spider):
             else:
                 self.logger.info(f"Skipping old article: {article_data['date']}")
 
-        # Pagination - look for next page
-        if page < 3 and len(articles_data) > 0:
+        # Pagination - look for next page, unless this page already reached old articles
+        reached_old = (len(articles_data) > 0 and articles_data[-1]['date'] is not None and
+                       articles_data[-1]['date'] < self.date_threshold)
+        if reached_old:
+            self.logger.info(f"Reached articles older than threshold on page {page}, stopping pagination")
+        elif page < 3 and len(articles_data) > 0:
             next_page = self.find_next_page(response)
             if next_page:
                 self.logger.info(f"Found next page: {next_page}")
@@ -71,26 +209,24 @@ class BankinformSpider(scrapy.Spider):
         Extract articles with titles and dates from bankinform.ru
         """
         articles_data = []
+        # One "now" for all relative dates on this page
+        now = datetime.now()
 
         # Find all article links with the specified class
-        article_links = response.css('a.text-decoration-none')
+        article_links = self._LINK_XPATH(response.selector.root)
 
         for link in article_links:
-            href = link.css('::attr(href)').get()
-            title = link.css('::text').get()
+            # Read attribute/text straight from the lxml element
+            href = link.get('href')
+            # Whole link text, including nested inline elements
+            title = self._TITLE_XPATH(link)
 
             if href and title and title.strip():
-                # Find date - look for time element with date class
-                date_element = link.xpath('./following-sibling::time[contains(@class, "date")] | '
-                                        '../time[contains(@class, "date")] | '
-                                        '../../time[contains(@class, "date")]').get()
-
-                date_text = None
-                if date_element:
-                    date_selector = scrapy.Selector(text=date_element)
-                    date_text = date_selector.css('::text').get()
+                # Find date - text of the nearest time element with date class
+                dates = self._DATE_XPATH(link)
+                date_text = dates[0] if dates else None
 
-                article_date = self.parse_date_text(date_text) if date_text else None
+                article_date = self.parse_date_text(date_text, now=now) if date_text else None
 
                 full_url = self.clean_url(href)
                 if full_url:
@@ -100,9 +236,15 @@ class BankinformSpider(scrapy.Spider):
                         'date': article_date
                     })
 
+                    # Listing is newest first - everything after the first old
+                    # article is older still, so stop here; the old article is
+                    # kept last so the caller can see where the cutoff was
+                    if article_date is not None and article_date < self.date_threshold:
+                        break
+
         return articles_data
 
-    def parse_date_text(self, date_text):
+    def parse_date_text(self, date_text, now=None):
         """Parse date text to datetime object"""
         if not date_text:
             return None
@@ -111,96 +253,34 @@ class BankinformSpider(scrapy.Spider):
         if not clean_text:
             return None
 
-        # Try Russian date format
-        date_obj = self.parse_russian_date(clean_text)
+        # Try Russian and standard date formats (cached)
+        date_obj = _parse_date_cached(clean_text)
         if date_obj:
             return date_obj
 
-        # Try relative dates
-        date_obj = self.parse_relative_date(clean_text)
-        if date_obj:
-            return date_obj
-
-        # Try standard date formats
-        date_obj = self.parse_standard_date(clean_text)
+        # Try relative dates - depend on the current time, so never cached
+        date_obj = self.parse_relative_date(clean_text, now=now)
         if date_obj:
             return date_obj
 
         return None
 
-    def parse_russian_date(self, date_str):
-        """
-        Parse Russian date format to datetime object
-        Handles formats like: '27 октября 2025'
-        """
-        try:
-            # Use regex to extract date parts
-            pattern = r'(\d{1,2})\s+([а-яё]+)\s+(\d{4})'
-            match = re.search(pattern, date_str)
-
-            if match:
-                day = int(match.group(1))
-                month_ru = match.group(2).lower()
-                year = int(match.group(3))
-
-                month_mapping = {
-                    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
-                    'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
-                    'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12
-                }
-
-                if month_ru in month_mapping:
-                    return datetime(year, month_mapping[month_ru], day)
-
-            return None
-        except Exception as e:
-            self.logger.warning(f"Failed to parse Russian date '{date_str}': {e}")
+    def parse_relative_date(self, date_str, now=None):
+        """Parse relative dates like '1 день назад', '2 часа назад', counted back from now"""
+        match = _RELATIVE_NUM_RE.search(date_str)
+        if not match:
             return None
 
-    def parse_standard_date(self, date_str):
-        """Parse standard date formats like DD.MM.YYYY"""
-        try:
-            # Try DD.MM.YYYY
-            pattern1 = r'(\d{1,2})\.(\d{1,2})\.(\d{4})'
-            match1 = re.search(pattern1, date_str)
-            if match1:
-                day = int(match1.group(1))
-                month = int(match1.group(2))
-                year = int(match1.group(3))
-                return datetime(year, month, day)
-
-            # Try YYYY-MM-DD
-            pattern2 = r'(\d{4})-(\d{1,2})-(\d{1,2})'
-            match2 = re.search(pattern2, date_str)
-            if match2:
-                year = int(match2.group(1))
-                month = int(match2.group(2))
-                day = int(match2.group(3))
-                return datetime(year, month, day)
+        amount = int(match.group())
 
+        unit_match = _RELATIVE_UNIT_RE.search(date_str)
+        if not unit_match:
             return None
-        except Exception as e:
-            self.logger.warning(f"Failed to parse standard date '{date_str}': {e}")
-            return None
+        unit = _RELATIVE_UNITS[unit_match.group()]
 
-    def parse_relative_date(self, date_str):
-        """Parse relative dates like '1 день назад', '2 часа назад'"""
         try:
-            numbers = re.findall(r'\d+', date_str)
-            if numbers:
-                amount = int(numbers[0])
-
-                if 'день' in date_str or 'дня' in date_str or 'дней' in date_str:
-                    return datetime.now() - timedelta(days=amount)
-                elif 'час' in date_str or 'часа' in date_str or 'часов' in date_str:
-                    return datetime.now() - timedelta(hours=amount)
-                elif 'минут' in date_str:
-                    return datetime.now() - timedelta(minutes=amount)
-                elif 'недел' in date_str:
-                    return datetime.now() - timedelta(weeks=amount)
-
-            return None
-        except Exception as e:
+            return (now or datetime.now()) - timedelta(**{unit: amount})
+        except OverflowError as e:
             self.logger.warning(f"Failed to parse relative date '{date_str}': {e}")
             return None
 
@@ -212,41 +292,28 @@ class BankinformSpider(scrapy.Spider):
         date_text = date_text.strip()
 
         # Remove icons and extra text
-        date_text = re.sub(r'[⏰🕒📅]', '', date_text)
-        date_text = re.sub(r'\s+', ' ', date_text)
+        date_text = date_text.translate(_ICON_TRANSLATE)
+        date_text = _WS_RE.sub(' ', date_text)
 
         # Check if it looks like a date
-        date_patterns = [
-            r'\d{1,2}\s+[а-яё]+\s+\d{4}',
-            r'\d{1,2}\.\d{1,2}\.\d{4}',
-            r'\d{1,2}/\d{1,2}/\d{4}',
-            r'\d{4}-\d{1,2}-\d{1,2}',
-            r'\d{1,2}\s+[а-яё]+',
-            r'\d+\s+(час|день|дня|дней|минут|недел)'
-        ]
-
-        for pattern in date_patterns:
-            if re.search(pattern, date_text, re.IGNORECASE):
+        for pattern in _DATE_VALIDATE_RES:
+            if pattern.search(date_text):
                 return date_text
 
         return None
 
     def find_next_page(self, response):
         """Find next page link"""
-        next_selectors = [
-            'a.next::attr(href)',
-            'a[rel="next"]::attr(href)',
-            '.pagination a:contains("Далее")::attr(href)',
-            '.pagination a:contains("Next")::attr(href)',
-            'a:contains("›")::attr(href)',
-            'a:contains("»")::attr(href)',
-            '.pager-next a::attr(href)'
-        ]
-
-        for selector in next_selectors:
-            next_page = response.css(selector).get()
-            if next_page:
-                return self.clean_url(next_page)
+        # One pass for the attribute-based links, one for the text-based ones
+        # (cssselect's :contains() is just a substring XPath, so use it directly)
+        next_page = (response.css('a.next::attr(href), a[rel="next"]::attr(href), '
+                                  '.pager-next a::attr(href)').get() or
+                     response.xpath('(//*[contains(concat(" ", normalize-space(@class), " "), " pagination ")]'
+                                    '//a[contains(., "Далее") or contains(., "Next")]/@href | '
+                                    '//a[contains(., "›") or contains(., "»")]/@href)[1]').get())
+
+        if next_page:
+            return self.clean_url(next_page)
 
         return None
 
@@ -282,37 +349,29 @@ class BankinformSpider(scrapy.Spider):
         # Extract description - look for <p> tags in the article content
         description = self.extract_description(response)
 
-        yield {
-            'title': title,
-            'url': response.url,
-            'search_term': 'bankinform-fintech',
-            'description': description,
-            'article_date': article_date.isoformat() if article_date else None,
-            'scraped_at': datetime.now().isoformat(),
-        }
+        yield ScrappyBankinformItem(
+            title=title,
+            url=response.url,
+            search_term='bankinform-fintech',
+            description=description,
+            article_date=article_date.isoformat() if article_date else None,
+            scraped_at=datetime.now().isoformat(),
+        )
 
     def extract_description(self, response):
         """Extract description from article content - first meaningful <p> tag"""
 
-        # Try to find the main article content
-        content_selectors = [
-            'article p',
-            '.article-content p',
-            '.post-content p',
-            '.content p',
-            '.entry-content p',
-            '.news-detail p',
-            '.text p'
-        ]
-
-        for selector in content_selectors:
-            paragraphs = response.css(selector)
-            for p in paragraphs:
-                text = p.css('::text').get()
-                if text:
-                    clean_text = self.clean_paragraph(text)
-                    if clean_text and len(clean_text) > 30:
-                        return clean_text
+        # Try to find the main article content - one DOM walk over all
+        # known content containers, paragraphs come back in document order
+        paragraphs = response.css('article p, .article-content p, .post-content p, .content p, '
+                                  '.entry-content p, .news-detail p, .text p')
+
+        for p in paragraphs:
+            text = p.xpath('descendant::text()').get()
+            if text:
+                clean_text = self.clean_paragraph(text)
+                if clean_text and len(clean_text) > 30:
+                    return clean_text
 
         # Fallback: get any first paragraph
         first_p = response.css('p::text').get()
@@ -328,23 +387,10 @@ class BankinformSpider(scrapy.Spider):
         if not text:
             return ""
 
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         text = text.strip()
 
-        # Filter out unwanted content
-        unwanted_patterns = [
-            'Подпишитесь',
-            'читайте также',
-            'реклама',
-            'advertisement',
-            'Фото:',
-            'Фотография:',
-            'Источник:',
-            'По материалам'
-        ]
-
-        for pattern in unwanted_patterns:
-            if pattern.lower() in text.lower():
-                return ""
+        if _UNWANTED_RE.search(text):
+            return ""
 
         return text
\ No newline at end of file
@@ -1,20 +1,254 @@
 import scrapy
-from urllib.parse import urljoin
+from lxml import etree
+from parsel import css2xpath
+from urllib.parse import urljoin, urlsplit
 import re
+import logging
+from functools import lru_cache
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
+_HOST = 'plusworld.ru'
+_BASE_URL = 'https://' + _HOST
+
+# Precompiled patterns used by the date/text helpers
+_RU_DATE_RE = re.compile(r'(\d{1,2})\s+([а-яё]+)\s+(\d{4})')
+_RELATIVE_NUM_RE = re.compile(r'\d+')
+# Relative-date unit words ('час' also covers 'часа'/'часов') and their timedelta names
+_RELATIVE_UNIT_RE = re.compile(r'день|дня|дней|час|минут|недел')
+_RELATIVE_UNITS = {
+    'день': 'days', 'дня': 'days', 'дней': 'days',
+    'час': 'hours',
+    'минут': 'minutes',
+    'недел': 'weeks',
+}
+_WS_RE = re.compile(r'\s+')
+_ICON_TRANSLATE = str.maketrans('', '', '⏰🕒📅')
+
+# Check if it looks like a date
+_DATE_VALIDATE_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'\d{1,2}\s+[а-яё]+\s+\d{4}',
+    r'\d{1,2}\.\d{1,2}\.\d{4}',
+    r'\d{1,2}/\d{1,2}/\d{4}',
+    r'\d{1,2}\s+[а-яё]+',
+    r'\d+\s+(час|день|дня|дней|минут|недел)',
+    r'\d+\s+(hour|day|days|minute|week)'
+)]
+
+# Filter out unwanted content
+_UNWANTED_PATTERNS = (
+    'Подпишитесь',
+    'читайте также',
+    'реклама',
+    'advertisement',
+    'Фото:',
+    'Фотография:',
+    'Источник:',
+    'По материалам',
+)
+# Any whitespace run between words matches, so raw paragraph text can be tested
+_UNWANTED_RE = re.compile(
+    '|'.join(r'\s+'.join(map(re.escape, p.split())) for p in _UNWANTED_PATTERNS),
+    re.IGNORECASE
+)
+
+
+def _compile_css(query):
+    """Translate a CSS query (parsel ::text/::attr included) into a compiled XPath once"""
+    return etree.XPath(css2xpath(query), smart_strings=False)
+
+
+def _first(xpath, node):
+    """First result of a compiled XPath on an lxml node, like SelectorList.get()"""
+    result = xpath(node)
+    return result[0] if result else None
+
+
+# Try different content containers
+_CONTENT_PARAGRAPH_XPATH = etree.XPath('(' + ' | '.join(css2xpath(selector) for selector in (
+    '.article-content p',
+    '.post-content p',
+    '.content p',
+    '.entry-content p',
+    '.text p',
+    'article p',
+    '.pw-detail .content p',
+)) + ')/descendant::text()[1]', smart_strings=False)
+_FIRST_PARAGRAPH_XPATH = _compile_css('p::text')
+
+_MONTH_MAPPING = {
+    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
+    'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
+    'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12
+}
+
+
+@lru_cache(maxsize=1024)
+def _clean_date_text(date_text):
+    """Clean and validate date text"""
+    if not date_text:
+        return None
+
+    date_text = date_text.strip()
+
+    # Remove icons and extra text
+    date_text = date_text.translate(_ICON_TRANSLATE)
+    date_text = _WS_RE.sub(' ', date_text)
+
+    # Check if it looks like a date
+    for pattern in _DATE_VALIDATE_RES:
+        if pattern.search(date_text):
+            return date_text
+
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_russian_date(date_str):
+    """
+    Parse Russian date format to datetime object
+    Handles formats like: '27 октября 2025'
+    """
+    try:
+        # Use regex to extract date parts
+        match = _RU_DATE_RE.search(date_str)
+
+        if match:
+            day = int(match.group(1))
+            month_ru = match.group(2).lower()
+            year = int(match.group(3))
+
+            month = _MONTH_MAPPING.get(month_ru)
+            if month is not None:
+                return datetime(year, month, day)
+
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to parse Russian date '{date_str}': {e}")
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_relative_offset(date_str):
+    """
+    Parse relative dates like '1 день назад' into a (timedelta unit, amount) pair
+    Only the offset is cached - the date itself depends on the current time
+    """
+    try:
+        match = _RELATIVE_NUM_RE.search(date_str)
+        if match:
+            unit = _RELATIVE_UNIT_RE.search(date_str)
+            if unit:
+                return _RELATIVE_UNITS[unit.group()], int(match.group())
+
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to parse relative date '{date_str}': {e}")
+        return None
+
+
+def _clean_url(url):
+    """Clean and normalize Plusworld.ru URLs"""
+    if not url:
+        return None
+
+    # Handle relative URLs - only those need joining with the base
+    # (malformed hrefs, e.g. a broken IPv6 host, are skipped)
+    try:
+        parts = urlsplit(url)
+        if not parts.scheme:
+            url = urljoin(_BASE_URL, url)
+            parts = urlsplit(url)
+    except ValueError:
+        return None
+
+    # Ensure it's a Plusworld.ru URL
+    if parts.scheme != 'https' or parts.netloc != _HOST or not parts.path:
+        return None
+
+    return url
+
+
+def _clean_paragraph(text):
+    """Clean paragraph text"""
+    if not text:
+        return ""
+
+    # Only normalize whitespace on paragraphs that are kept
+    if _UNWANTED_RE.search(text):
+        return ""
+    return _WS_RE.sub(' ', text).strip()
+
+
 class PlusworldSpider(scrapy.Spider):
     name = 'plusworld'
     allowed_domains = ['plusworld.ru']
 
+    # Every listing element any extraction method may need, in one DOM walk:
+    # cards, direct article links and popular sections
+    _LISTING_XPATH = etree.XPath(
+        "//*[contains(concat(' ', normalize-space(@class), ' '), ' card ')] | "
+        "//a[contains(@href, '/articles/')] | "
+        "//*[contains(concat(' ', normalize-space(@class), ' '), ' popular-embed ') or "
+        "contains(concat(' ', normalize-space(@class), ' '), ' popular-line ') or "
+        "contains(concat(' ', normalize-space(@class), ' '), ' box-news ')]"
+    )
+    _POPULAR_CLASSES = {'popular-embed', 'popular-line', 'box-news'}
+
+    # Per-element lookups, translated from CSS once instead of on every call
+    _CARD_LINK_XPATH = _compile_css('a::attr(href)')
+    _CARD_TITLE_XPATH = _compile_css('.card__title::text, .card-title::text, h3::text, h4::text')
+    _CARD_DATE_XPATH = _compile_css('.meta span::text, .date::text, time::text')
+    _LINK_HREF_XPATH = _compile_css('::attr(href)')
+    _LINK_TEXT_XPATH = _compile_css('::text')
+    _POPULAR_LINK_XPATH = _compile_css('a[href*="/articles/"]::attr(href)')
+    _POPULAR_TITLE_XPATH = _compile_css('a::text')
+    _POPULAR_DATE_XPATH = _compile_css('.date::text, .meta::text')
+    _TITLE_XPATHS = tuple(_compile_css(selector) for selector in (
+        'h1::text',
+        '.article-title::text',
+        'title::text',
+    ))
+    # Sibling spans and nearby meta blocks, in priority order - kept as
+    # separate paths because a union would return them in document order
+    _NEAR_DATE_XPATHS = tuple(etree.XPath(path, smart_strings=False) for path in (
+        'following-sibling::span//text()',
+        'preceding-sibling::span//text()',
+        '../span//text()',
+        '../../span//text()',
+        '../div[contains(@class, "meta")]//text()',
+        '../../div[contains(@class, "meta")]//text()'
+    ))
+    _NEXT_PAGE_XPATHS = tuple(_compile_css(selector) for selector in (
+        'a.next::attr(href)',
+        'a[rel="next"]::attr(href)',
+        '.pagination a:contains("Далее")::attr(href)',
+        '.pagination a:contains("Next")::attr(href)',
+        'a:contains("›")::attr(href)',
+        'a:contains("»")::attr(href)'
+    ))
+
     custom_settings = {
         'ROBOTSTXT_OBEY': False,
         'DOWNLOAD_TIMEOUT': 30,
         'DOWNLOAD_DELAY': 2,
-        'CONCURRENT_REQUESTS': 1,
+        # A few parallel slots per domain keep pooled HTTP/1.1 connections warm;
+        # all sections share the one plusworld.ru slot, so DOWNLOAD_DELAY still
+        # spaces requests at least 2s apart
+        'CONCURRENT_REQUESTS': 8,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 2,
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 2,
+        # Start at the DOWNLOAD_DELAY floor instead of AutoThrottle's 5s default
+        'AUTOTHROTTLE_START_DELAY': 2,
+        'AUTOTHROTTLE_MAX_DELAY': 10,
+        'RETRY_ENABLED': True,
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'FEED_FORMAT': 'json',
-        'FEED_URI': 'file:///app/data/plusworld_articles_%(time)s.json',
+        # JSON Lines: each item is written as soon as it is scraped
+        'FEEDS': {
+            'file:///app/data/plusworld_articles_%(time)s.jsonl': {'format': 'jsonlines'},
+        },
     }
 
     def __init__(self, *args, **kwargs):
@@ -70,30 +304,35 @@ class PlusworldSpider(scrapy.Spider):
             articles_data = articles_data[7:]
             self.logger.info(f"Skipped first 7 articles, {len(articles_data)} remaining for {search_term}")
 
+        # Drop old articles and spend the 15-article budget on the newest ones
+        # (undated articles are kept, sorted after the dated ones)
+        has_articles = len(articles_data) > 0
+        recent = [a for a in articles_data if a['date'] is None or a['date'] >= self.date_threshold]
+        skipped = len(articles_data) - len(recent)
+        if skipped:
+            self.logger.info(f"Skipping {skipped} old articles from {search_term}")
+        recent.sort(key=lambda a: a['date'] or datetime.min, reverse=True)
+        articles_data = recent[:15]  # Limit to 15 articles per page
+
         self.logger.info(f"Processing {len(articles_data)} articles for {search_term} after filtering")
 
         # Follow article links to get full content
-        article_count = 0
-        for article_data in articles_data[:15]:  # Limit to 15 articles per page
-            if article_data['date'] is None or article_data['date'] >= self.date_threshold:
-                article_count += 1
-                self.logger.info(f"Yielding article request for {search_term}: {article_data['title'][:50]}...")
-                yield scrapy.Request(
-                    url=article_data['url'],
-                    callback=self.parse_article,
-                    meta={
-                        'search_term': search_term,
-                        'article_date': article_data['date'],
-                        'title': article_data['title']
-                    }
-                )
-            else:
-                self.logger.info(f"Skipping old article from {search_term}: {article_data['date']}")
+        for article_data in articles_data:
+            self.logger.info("Yielding article request for %s: %.50s...", search_term, article_data['title'])
+            yield scrapy.Request(
+                url=article_data['url'],
+                callback=self.parse_article,
+                meta={
+                    'search_term': search_term,
+                    'article_date': article_data['date'],
+                    'title': article_data['title']
+                }
+            )
 
-        self.logger.info(f"Yielded {article_count} article requests for {search_term} page {page}")
+        self.logger.info(f"Yielded {len(articles_data)} article requests for {search_term} page {page}")
 
         # Pagination - look for next page
-        if page < 3 and len(articles_data) > 0:
+        if page < 3 and has_articles:
             next_page = self.find_next_page(response)
             if next_page:
                 self.logger.info(f"Found next page for {search_term}: {next_page}")
@@ -117,239 +356,146 @@ class PlusworldSpider(scrapy.Spider):
         Based on the actual HTML structure
         """
         articles_data = []
+        seen_urls = set()
+        # One "now" for all relative dates on this page
+        now = datetime.now()
+
+        # Sort the listing elements into the candidates for each method
+        cards, article_links, popular_sections = [], [], []
+        for element in self._LISTING_XPATH(response.selector.root):
+            classes = set((element.get('class') or '').split())
+            if 'card' in classes:
+                cards.append(element)
+            if element.tag == 'a' and '/articles/' in element.get('href', ''):
+                article_links.append(element)
+            if classes & self._POPULAR_CLASSES:
+                popular_sections.append(element)
 
         # Method 1: Look for cards in the "Также по теме" or "Другие статьи" sections
-        cards = response.css('.card, .pw-wide .card, .section .card')
         self.logger.info(f"Found {len(cards)} card elements")
 
         for card in cards:
-            link = card.css('a::attr(href)').get()
-            title = card.css('.card__title::text, .card-title::text, h3::text, h4::text').get()
+            link = _first(self._CARD_LINK_XPATH, card)
+            title = _first(self._CARD_TITLE_XPATH, card)
 
             if link and title and title.strip():
                 # Extract date from the card
-                date_text = card.css('.meta span::text, .date::text, time::text').get()
-                article_date = self.parse_date_text(date_text) if date_text else None
+                date_text = _first(self._CARD_DATE_XPATH, card)
+                article_date = self.parse_date_text(date_text, now=now) if date_text else None
 
-                full_url = self.clean_url(link)
-                if full_url and '/articles/' in full_url:
+                full_url = _clean_url(link)
+                if full_url and '/articles/' in full_url and full_url not in seen_urls:
+                    seen_urls.add(full_url)
                     articles_data.append({
                         'url': full_url,
                         'title': title.strip(),
                         'date': article_date
                     })
-                    self.logger.debug(f"Found article from card: {title[:50]}...")
+                    self.logger.debug("Found article from card: %.50s...", title)
 
         # Method 2: Look for direct article links in content
         if not articles_data:
-            article_links = response.css('a[href*="/articles/"]')
             self.logger.info(f"Found {len(article_links)} article links")
             for link in article_links:
-                href = link.css('::attr(href)').get()
-                title = link.css('::text').get()
+                href = _first(self._LINK_HREF_XPATH, link)
+                title = _first(self._LINK_TEXT_XPATH, link)
 
                 if href and title and title.strip() and len(title.strip()) > 10:
                     # Look for date in parent or nearby elements
                     date_text = self.find_date_near_element(link)
-                    article_date = self.parse_date_text(date_text) if date_text else None
+                    article_date = self.parse_date_text(date_text, now=now) if date_text else None
 
-                    full_url = self.clean_url(href)
-                    if full_url:
+                    full_url = _clean_url(href)
+                    if full_url and full_url not in seen_urls:
+                        seen_urls.add(full_url)
                         articles_data.append({
                             'url': full_url,
                             'title': title.strip(),
                             'date': article_date
                         })
-                        self.logger.debug(f"Found article from link: {title[:50]}...")
+                        self.logger.debug("Found article from link: %.50s...", title)
 
         # Method 3: Look for articles in specific sections
         if not articles_data:
             # Try to find articles in popular sections
-            popular_sections = response.css('.popular-embed, .popular-line, .box-news')
             self.logger.info(f"Found {len(popular_sections)} popular sections")
             for section in popular_sections:
-                link = section.css('a[href*="/articles/"]::attr(href)').get()
-                title = section.css('a::text').get()
+                link = _first(self._POPULAR_LINK_XPATH, section)
+                title = _first(self._POPULAR_TITLE_XPATH, section)
 
                 if link and title and title.strip():
-                    date_text = section.css('.date::text, .meta::text').get()
-                    article_date = self.parse_date_text(date_text) if date_text else None
+                    date_text = _first(self._POPULAR_DATE_XPATH, section)
+                    article_date = self.parse_date_text(date_text, now=now) if date_text else None
 
-                    full_url = self.clean_url(link)
-                    if full_url:
+                    full_url = _clean_url(link)
+                    if full_url and full_url not in seen_urls:
+                        seen_urls.add(full_url)
                         articles_data.append({
                             'url': full_url,
                             'title': title.strip(),
                             'date': article_date
                         })
-                        self.logger.debug(f"Found article from popular section: {title[:50]}...")
-
-        # Remove duplicates by URL
-        unique_articles = {}
-        for article in articles_data:
-            if article['url'] not in unique_articles:
-                unique_articles[article['url']] = article
+                        self.logger.debug("Found article from popular section: %.50s...", title)
 
-        result = list(unique_articles.values())
-        self.logger.info(f"After deduplication: {len(result)} unique articles")
-        return result
+        self.logger.info(f"After deduplication: {len(articles_data)} unique articles")
+        return articles_data
 
     def find_date_near_element(self, element):
         """Find date text near a link element"""
         # Look in sibling elements
-        date_selectors = [
-            'following-sibling::span//text()',
-            'preceding-sibling::span//text()',
-            '../span//text()',
-            '../../span//text()',
-            '../div[contains(@class, "meta")]//text()',
-            '../../div[contains(@class, "meta")]//text()'
-        ]
-
-        for selector in date_selectors:
-            date_text = element.xpath(selector).get()
+        for xpath in self._NEAR_DATE_XPATHS:
+            date_text = _first(xpath, element)
             if date_text:
-                clean_date = self.clean_date_text(date_text)
+                clean_date = _clean_date_text(date_text)
                 if clean_date:
                     return clean_date
 
         return None
 
-    def clean_date_text(self, date_text):
-        """Clean and validate date text"""
-        if not date_text:
-            return None
-
-        date_text = date_text.strip()
-
-        # Remove icons and extra text
-        date_text = re.sub(r'[⏰🕒📅]', '', date_text)
-        date_text = re.sub(r'\s+', ' ', date_text)
-
-        # Check if it looks like a date
-        date_patterns = [
-            r'\d{1,2}\s+[а-яё]+\s+\d{4}',
-            r'\d{1,2}\.\d{1,2}\.\d{4}',
-            r'\d{1,2}/\d{1,2}/\d{4}',
-            r'\d{1,2}\s+[а-яё]+',
-            r'\d+\s+(час|день|дня|дней|минут|недел)',
-            r'\d+\s+(hour|day|days|minute|week)'
-        ]
-
-        for pattern in date_patterns:
-            if re.search(pattern, date_text, re.IGNORECASE):
-                return date_text
-
-        return None
-
-    def parse_date_text(self, date_text):
+    def parse_date_text(self, date_text, now=None):
         """Parse date text to datetime object"""
         if not date_text:
             return None
 
-        clean_text = self.clean_date_text(date_text)
+        clean_text = _clean_date_text(date_text)
         if not clean_text:
             return None
 
         # Try Russian date format first
-        date_obj = self.parse_russian_date(clean_text)
+        date_obj = _parse_russian_date(clean_text)
         if date_obj:
             return date_obj
 
         # Try relative dates
-        date_obj = self.parse_relative_date(clean_text)
+        date_obj = self.parse_relative_date(clean_text, now=now)
         if date_obj:
             return date_obj
 
         return None
 
-    def parse_russian_date(self, date_str):
-        """
-        Parse Russian date format to datetime object
-        Handles formats like: '27 октября 2025'
-        """
-        try:
-            # Use regex to extract date parts
-            pattern = r'(\d{1,2})\s+([а-яё]+)\s+(\d{4})'
-            match = re.search(pattern, date_str)
-
-            if match:
-                day = int(match.group(1))
-                month_ru = match.group(2).lower()
-                year = int(match.group(3))
-
-                month_mapping = {
-                    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
-                    'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
-                    'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12
-                }
-
-                if month_ru in month_mapping:
-                    return datetime(year, month_mapping[month_ru], day)
-
-            return None
-        except Exception as e:
-            self.logger.warning(f"Failed to parse Russian date '{date_str}': {e}")
+    def parse_relative_date(self, date_str, now=None):
+        """Parse relative dates like '1 день назад', '2 часа назад', counted back from now"""
+        offset = _parse_relative_offset(date_str)
+        if offset is None:
             return None
 
-    def parse_relative_date(self, date_str):
-        """Parse relative dates like '1 день назад', '2 часа назад'"""
+        unit, amount = offset
         try:
-            numbers = re.findall(r'\d+', date_str)
-            if numbers:
-                amount = int(numbers[0])
-
-                if 'день' in date_str or 'дня' in date_str or 'дней' in date_str:
-                    return datetime.now() - timedelta(days=amount)
-                elif 'час' in date_str or 'часа' in date_str or 'часов' in date_str:
-                    return datetime.now() - timedelta(hours=amount)
-                elif 'минут' in date_str:
-                    return datetime.now() - timedelta(minutes=amount)
-                elif 'недел' in date_str:
-                    return datetime.now() - timedelta(weeks=amount)
-
-            return None
+            return (now or datetime.now()) - timedelta(**{unit: amount})
         except Exception as e:
             self.logger.warning(f"Failed to parse relative date '{date_str}': {e}")
             return None
 
     def find_next_page(self, response):
         """Find next page link"""
-        next_selectors = [
-            'a.next::attr(href)',
-            'a[rel="next"]::attr(href)',
-            '.pagination a:contains("Далее")::attr(href)',
-            '.pagination a:contains("Next")::attr(href)',
-            'a:contains("›")::attr(href)',
-            'a:contains("»")::attr(href)'
-        ]
-
-        for selector in next_selectors:
-            next_page = response.css(selector).get()
+        root = response.selector.root
+        for xpath in self._NEXT_PAGE_XPATHS:
+            next_page = _first(xpath, root)
             if next_page:
-                return self.clean_url(next_page)
+                return _clean_url(next_page)
 
         return None
 
-    def clean_url(self, url):
-        """Clean and normalize Plusworld.ru URLs"""
-        if not url:
-            return None
-
-        # Handle relative URLs
-        if url.startswith('//'):
-            url = 'https:' + url
-        elif url.startswith('/'):
-            url = urljoin('https://plusworld.ru', url)
-        elif not url.startswith('http'):
-            url = urljoin('https://plusworld.ru', url)
-
-        # Ensure it's a Plusworld.ru URL
-        if not url.startswith('https://plusworld.ru/'):
-            return None
-
-        return url
-
     def parse_article(self, response):
         search_term = response.meta.get('search_term', 'digital-banking')
         article_date = response.meta.get('article_date')
@@ -358,9 +504,11 @@ class PlusworldSpider(scrapy.Spider):
         # Extract title - prefer the one from list page, fallback to article page
         title = title_from_list
         if not title:
-            title = (response.css('h1::text').get() or
-                    response.css('.article-title::text').get() or
-                    response.css('title::text').get() or "").strip()
+            for xpath in self._TITLE_XPATHS:
+                title = _first(xpath, response.selector.root)
+                if title:
+                    break
+            title = (title or "").strip()
 
         # Clean title
         if ' | Plusworld.ru' in title:
@@ -369,7 +517,7 @@ class PlusworldSpider(scrapy.Spider):
         # Extract description - get first meaningful paragraph from article content
         description = self.extract_first_paragraph(response)
 
-        self.logger.info(f"Successfully scraped article from {search_term}: {title[:50]}...")
+        self.logger.info("Successfully scraped article from %s: %.50s...", search_term, title)
 
         yield {
             'title': title,
@@ -383,57 +531,19 @@ class PlusworldSpider(scrapy.Spider):
     def extract_first_paragraph(self, response):
         """Extract first meaningful paragraph from article content"""
 
-        # Try different content containers
-        content_selectors = [
-            '.article-content p',
-            '.post-content p',
-            '.content p',
-            '.entry-content p',
-            '.text p',
-            'article p',
-            '.pw-detail .content p'
-        ]
-
-        for selector in content_selectors:
-            paragraphs = response.css(selector)
-            for p in paragraphs:
-                text = p.css('::text').get()
-                if text:
-                    clean_text = self.clean_paragraph(text)
-                    if clean_text and len(clean_text) > 30:
-                        return clean_text
+        # First text node of every paragraph in any known content container,
+        # in document order - one XPath evaluation instead of one per container
+        root = response.selector.root
+        for text in _CONTENT_PARAGRAPH_XPATH(root):
+            clean_text = _clean_paragraph(text)
+            if clean_text and len(clean_text) > 30:
+                return clean_text
 
         # Fallback: get any first paragraph
-        first_p = response.css('p::text').get()
+        first_p = _first(_FIRST_PARAGRAPH_XPATH, root)
         if first_p:
-            clean_text = self.clean_paragraph(first_p)
+            clean_text = _clean_paragraph(first_p)
             if clean_text:
                 return clean_text
 
         return "Description not available"
-
-    def clean_paragraph(self, text):
-        """Clean paragraph text"""
-        if not text:
-            return ""
-
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-
-        # Filter out unwanted content
-        unwanted_patterns = [
-            'Подпишитесь',
-            'читайте также',
-            'реклама',
-            'advertisement',
-            'Фото:',
-            'Фотография:',
-            'Источник:',
-            'По материалам'
-        ]
-
-        for pattern in unwanted_patterns:
-            if pattern.lower() in text.lower():
-                return ""
-
-        return text
\ No newline at end of file
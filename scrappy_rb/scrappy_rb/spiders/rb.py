@@ -1,20 +1,157 @@
 import scrapy
-from urllib.parse import urljoin
+from lxml import etree
+from parsel import css2xpath
+from urllib.parse import urljoin, urlsplit
 import re
+import logging
+from functools import lru_cache
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
+_HOST = 'rb.ru'
+_BASE_URL = 'https://' + _HOST
+
+# Precompiled patterns used by the date/text helpers
+_RU_DATE_RE = re.compile(r'(\d{1,2})\s+([а-яё]+)\s+(\d{4})')
+_WS_RE = re.compile(r'\s+')
+
+# Filter out unwanted content
+_UNWANTED_PATTERNS = (
+    'Подпишитесь',
+    'читайте также',
+    'реклама',
+    'advertisement',
+    'Фото:',
+    'Фотография:',
+    'Источник:',
+)
+# Any whitespace run between words matches, so raw paragraph text can be tested
+_UNWANTED_RE = re.compile(
+    '|'.join(r'\s+'.join(map(re.escape, p.split())) for p in _UNWANTED_PATTERNS),
+    re.IGNORECASE
+)
+
+
+def _compile_css(query):
+    """Translate a CSS query (parsel ::text/::attr included) into a compiled XPath once"""
+    return etree.XPath(css2xpath(query), smart_strings=False)
+
+
+def _first(xpath, node):
+    """First result of a compiled XPath on an lxml node, like SelectorList.get()"""
+    result = xpath(node)
+    return result[0] if result else None
+
+
+# Try different content containers
+_CONTENT_PARAGRAPH_XPATH = etree.XPath('(' + ' | '.join(css2xpath(selector) for selector in (
+    '.news-item__content p',
+    '.article__content p',
+    '.post-content p',
+    '.content p',
+    '.text p',
+)) + ')/descendant::text()[1]', smart_strings=False)
+_FIRST_PARAGRAPH_XPATH = _compile_css('p::text')
+
+_MONTH_MAPPING = {
+    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
+    'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
+    'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_russian_date(date_str):
+    """
+    Parse Russian date format using regex
+    """
+    try:
+        # Use regex to extract date parts
+        match = _RU_DATE_RE.search(date_str)
+
+        if match:
+            day = int(match.group(1))
+            month_ru = match.group(2).lower()
+            year = int(match.group(3))
+
+            month = _MONTH_MAPPING.get(month_ru)
+            if month is not None:
+                return datetime(year, month, day)
+
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to parse date '{date_str}': {e}")
+        return None
+
+
+def _clean_url(url):
+    """Clean and normalize RB.ru URLs"""
+    if not url:
+        return None
+
+    # Handle relative URLs - only those need joining with the base
+    # (malformed hrefs, e.g. a broken IPv6 host, are skipped)
+    try:
+        parts = urlsplit(url)
+        if not parts.scheme:
+            url = urljoin(_BASE_URL, url)
+            parts = urlsplit(url)
+    except ValueError:
+        return None
+
+    # Ensure it's an RB.ru URL
+    if parts.scheme != 'https' or parts.netloc != _HOST or not parts.path:
+        return None
+
+    return url
+
+
+def _clean_paragraph(text):
+    """Clean paragraph text"""
+    if not text:
+        return ""
+
+    # Only normalize whitespace on paragraphs that are kept
+    if _UNWANTED_RE.search(text):
+        return ""
+    return _WS_RE.sub(' ', text).strip()
+
+
 class RbSpider(scrapy.Spider):
     name = 'rb'
     allowed_domains = ['rb.ru']
 
+    # Search result lookups, translated from CSS once instead of on every call
+    # Kept as an XPath string for response.xpath(): the items stay parsel
+    # Selectors so the mixed element/attribute link fallback can use item.css()
+    _ITEM_QUERY = css2xpath('.news-item, .search-result-item, [class*="item"]')
+    _ITEM_DATE_XPATH = _compile_css('time.news-item__date::text, .news-item__date::text, time::text')
+    _TITLE_LINK_XPATH = _compile_css('a.news-item__title::attr(href)')
+    _TITLE_XPATHS = tuple(_compile_css(selector) for selector in (
+        'h1.news-item__title::text',
+        'h1.article__title::text',
+        'h1::text',
+        'title::text',
+    ))
+    _NEXT_PAGE_XPATHS = (
+        _compile_css('a.pagination__next::attr(href)'),
+        _compile_css('a[rel="next"]::attr(href)'),
+    )
+
     custom_settings = {
         'ROBOTSTXT_OBEY': False,
         'DOWNLOAD_TIMEOUT': 30,
         'DOWNLOAD_DELAY': 2,
-        'CONCURRENT_REQUESTS': 1,
+        # A few parallel slots per domain keep pooled HTTP/1.1 connections warm
+        'CONCURRENT_REQUESTS': 4,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 2,
+        'RETRY_ENABLED': True,
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'FEED_FORMAT': 'json',
-        'FEED_URI': 'file:///app/data/rb_articles_%(time)s.json',
+        # JSON Lines: each item is written as soon as it is scraped
+        'FEEDS': {
+            'file:///app/data/rb_articles_%(time)s.jsonl': {'format': 'jsonlines'},
+        },
     }
 
     def __init__(self, *args, **kwargs):
@@ -41,36 +178,35 @@ class RbSpider(scrapy.Spider):
         self.logger.info(f"Parsing RB.ru search results for '{search_term}' - page {page}")
 
         # Extract article items with dates
-        article_items = response.css('.news-item, .search-result-item, [class*="item"]')
+        root = response.selector.root
+        article_items = response.xpath(self._ITEM_QUERY)
         article_links = []
 
         for item in article_items:
             # Extract date from time.news-item__date
-            date_element = item.css('time.news-item__date::text, .news-item__date::text, time::text').get()
+            date_element = _first(self._ITEM_DATE_XPATH, item.root)
             if date_element:
-                article_date = self.parse_russian_date(date_element.strip())
+                article_date = _parse_russian_date(date_element.strip())
                 if article_date and article_date >= self.date_threshold:
                     # Date is within range, extract link
-                    link = item.css('a.news-item__title::attr(href)').get()
+                    link = _first(self._TITLE_LINK_XPATH, item.root)
                     if not link:
                         link = item.css('a[href*="/news/"], a[href*="/article/"]::attr(href)').get()
 
                     if link:
-                        full_url = self.clean_url(link)
+                        full_url = _clean_url(link)
                         if full_url and full_url not in article_links:
                             article_links.append(full_url)
-                            self.logger.info(f"Recent article found: {article_date.strftime('%d.%m.%Y')} - {full_url}")
+                            self.logger.info("Recent article found: %s - %s", article_date, full_url)
                 elif article_date:
-                    self.logger.debug(f"Article too old: {article_date.strftime('%d.%m.%Y')}")
+                    self.logger.debug("Article too old: %s", article_date)
 
         # If no date filtering found articles, fallback to all articles
         if not article_links:
             self.logger.info("No recent articles found with dates, falling back to all articles")
-            title_links = response.css('a.news-item__title')
-            for link in title_links:
-                href = link.css('::attr(href)').get()
+            for href in self._TITLE_LINK_XPATH(root):
                 if href:
-                    full_url = self.clean_url(href)
+                    full_url = _clean_url(href)
                     if full_url and full_url not in article_links:
                         article_links.append(full_url)
 
@@ -86,12 +222,14 @@ class RbSpider(scrapy.Spider):
 
         # Pagination for RB.ru
         if page < 3:
-            next_page = response.css('a.pagination__next::attr(href)').get()
-            if not next_page:
-                next_page = response.css('a[rel="next"]::attr(href)').get()
+            next_page = None
+            for xpath in self._NEXT_PAGE_XPATHS:
+                next_page = _first(xpath, root)
+                if next_page:
+                    break
 
             if next_page:
-                next_url = self.clean_url(next_page)
+                next_url = _clean_url(next_page)
                 if next_url:
                     yield scrapy.Request(
                         url=next_url,
@@ -99,61 +237,17 @@ class RbSpider(scrapy.Spider):
                         meta={'search_term': search_term, 'page': page + 1}
                     )
 
-    def parse_russian_date(self, date_str):
-        """
-        Parse Russian date format using regex
-        """
-        try:
-            # Use regex to extract date parts
-            pattern = r'(\d{1,2})\s+([а-яё]+)\s+(\d{4})'
-            match = re.search(pattern, date_str)
-
-            if match:
-                day = int(match.group(1))
-                month_ru = match.group(2).lower()
-                year = int(match.group(3))
-
-                month_mapping = {
-                    'января': 1, 'февраля': 2, 'марта': 3, 'апреля': 4,
-                    'мая': 5, 'июня': 6, 'июля': 7, 'августа': 8,
-                    'сентября': 9, 'октября': 10, 'ноября': 11, 'декабря': 12
-                }
-
-                if month_ru in month_mapping:
-                    return datetime(year, month_mapping[month_ru], day)
-
-            return None
-        except Exception as e:
-            self.logger.warning(f"Failed to parse date '{date_str}': {e}")
-            return None
-
-    def clean_url(self, url):
-        """Clean and normalize RB.ru URLs"""
-        if not url:
-            return None
-
-        # Handle relative URLs
-        if url.startswith('//'):
-            url = 'https:' + url
-        elif url.startswith('/'):
-            url = urljoin('https://rb.ru', url)
-        elif not url.startswith('http'):
-            url = urljoin('https://rb.ru', url)
-
-        # Ensure it's an RB.ru URL
-        if not url.startswith('https://rb.ru/'):
-            return None
-
-        return url
-
     def parse_article(self, response):
         search_term = response.meta['search_term']
 
-        # Extract title - multiple selectors for RB.ru
-        title = (response.css('h1.news-item__title::text').get() or
-                response.css('h1.article__title::text').get() or
-                response.css('h1::text').get() or
-                response.css('title::text').get() or "").strip()
+        # Extract title - multiple selectors for RB.ru, first hit wins
+        root = response.selector.root
+        title = None
+        for xpath in self._TITLE_XPATHS:
+            title = _first(xpath, root)
+            if title:
+                break
+        title = (title or "").strip()
 
         # Clean title
         if ' | RB.RU' in title:
@@ -161,9 +255,9 @@ class RbSpider(scrapy.Spider):
 
         # Extract article date from the article page
         article_date = None
-        date_element = response.css('time.news-item__date::text, .news-item__date::text, time::text').get()
+        date_element = _first(self._ITEM_DATE_XPATH, root)
         if date_element:
-            article_date = self.parse_russian_date(date_element.strip())
+            article_date = _parse_russian_date(date_element.strip())
 
         # Extract description - get first meaningful paragraph from article content
         description = self.extract_first_paragraph(response)
@@ -179,54 +273,19 @@ class RbSpider(scrapy.Spider):
     def extract_first_paragraph(self, response):
         """Extract first meaningful paragraph from article content"""
 
-        # Try different content containers used by RB.ru
-        content_selectors = [
-            '.news-item__content p',
-            '.article__content p',
-            '.post-content p',
-            '.content p',
-            '.text p'
-        ]
-
-        for selector in content_selectors:
-            paragraphs = response.css(selector)
-            for p in paragraphs:
-                text = p.css('::text').get()
-                if text:
-                    clean_text = self.clean_paragraph(text)
-                    if clean_text and len(clean_text) > 30:
-                        return clean_text
+        # First text node of every paragraph in any known content container,
+        # in document order - one XPath evaluation instead of one per container
+        root = response.selector.root
+        for text in _CONTENT_PARAGRAPH_XPATH(root):
+            clean_text = _clean_paragraph(text)
+            if clean_text and len(clean_text) > 30:
+                return clean_text
 
         # Fallback: get any first paragraph
-        first_p = response.css('p::text').get()
+        first_p = _first(_FIRST_PARAGRAPH_XPATH, root)
         if first_p:
-            clean_text = self.clean_paragraph(first_p)
+            clean_text = _clean_paragraph(first_p)
             if clean_text:
                 return clean_text
 
         return "Description not available"
-
-    def clean_paragraph(self, text):
-        """Clean paragraph text"""
-        if not text:
-            return ""
-
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-
-        # Filter out unwanted content
-        unwanted_patterns = [
-            'Подпишитесь',
-            'читайте также',
-            'реклама',
-            'advertisement',
-            'Фото:',
-            'Фотография:',
-            'Источник:'
-        ]
-
-        for pattern in unwanted_patterns:
-            if pattern.lower() in text.lower():
-                return ""
-
-        return text
\ No newline at end of file
@@ -7,6 +7,7 @@ import scrapy
 
 
 class ScrapyBankcnewsItem(scrapy.Item):
-    # define the fields for your item here like:
-    # name = scrapy.Field()
-    pass
+    title = scrapy.Field()
+    url = scrapy.Field()
+    search_term = scrapy.Field()
+    description = scrapy.Field()
@@ -1,19 +1,85 @@
 import scrapy
-from urllib.parse import urljoin, urlparse
+from lxml import etree
+from parsel import css2xpath
+from urllib.parse import urljoin
 import re
+from scrapy_bankcnews.items import ScrapyBankcnewsItem
+
+_BASE_URL = 'https://www.cnews.ru'
+
+# Look for URLs in the format /news/date_article_name or /articles/date_article_name
+# (or /line/...), all three sections in one pass over the page
+_HREF_RE = re.compile(r'href=["\'](/(?:news|articles|line)/\d{4}-\d{2}-\d{2}_[^"\'\s>]+)["\']')
+
+# Remove HTML entities and malformed content
+_MALFORMED_HREF_RE = re.compile(r'%3Ca.*?href=%22')
+_MALFORMED_TAIL_RE = re.compile(r'%22.*%3E.*%3C/a%3E')
+
+# Paragraphs that are ads or cross-links, not article text
+_AD_RE = re.compile(r'реклама|advertisement|читать также', re.IGNORECASE)
+
+# CNews URL with a /news/, /articles/ or /line/ segment anywhere after the host
+_VALID_ARTICLE_RE = re.compile(r'https://www\.cnews\.ru/(?:.*?/)?(?:news|articles|line)/')
+
+
+def _compile_css(query):
+    """Translate a CSS query (parsel ::text/::attr included) into a compiled XPath once"""
+    return etree.XPath(css2xpath(query), smart_strings=False)
+
+
+def _first(xpath, node):
+    """First result of a compiled XPath on an lxml node, like SelectorList.get()"""
+    result = xpath(node)
+    return result[0] if result else None
+
 
 class CnewsSpider(scrapy.Spider):
     name = 'bankcnews'
     allowed_domains = ['cnews.ru']
 
+    # Articles followed per search page
+    _ARTICLES_PER_PAGE = 10
+
+    # Search result hrefs as plain strings, translated from CSS once
+    _SEARCH_HREF_XPATH = _compile_css(
+        '.search-results a::attr(href), .news-item a::attr(href), .article-item a::attr(href), '
+        'a[href*="/news/"]::attr(href), a[href*="/articles/"]::attr(href)'
+    )
+    _CONTENT_TEXT_XPATH = _compile_css('.news_container p::text, article p::text, .article-content p::text')
+    _TITLE_XPATHS = tuple(_compile_css(selector) for selector in (
+        'h1::text',
+        '.article-title::text',
+        'title::text',
+    ))
+
     custom_settings = {
         'ROBOTSTXT_OBEY': False,
         'DOWNLOAD_TIMEOUT': 30,
-        'DOWNLOAD_DELAY': 2,
-        'CONCURRENT_REQUESTS': 1,
+        'DOWNLOAD_DELAY': 0,
+        'RANDOMIZE_DOWNLOAD_DELAY': True,
+        'CONCURRENT_REQUESTS': 16,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 8,
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 4.0,
+        'AUTOTHROTTLE_START_DELAY': 1,
+        'AUTOTHROTTLE_MAX_DELAY': 10,
+        # gzip/deflate/br responses are decoded by HttpCompressionMiddleware
+        'COMPRESSION_ENABLED': True,
+        # Replay pages from disk on reruns (stored under .scrapy/httpcache)
+        'HTTPCACHE_ENABLED': True,
+        'HTTPCACHE_EXPIRATION_SECS': 3600,
+        'HTTPCACHE_DIR': 'httpcache',
+        'HTTPCACHE_STORAGE': 'scrapy.extensions.httpcache.FilesystemCacheStorage',
+        'HTTPCACHE_POLICY': 'scrapy.extensions.httpcache.RFC2616Policy',
         'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
     }
 
+    def __init__(self, *args, **kwargs):
+        super(CnewsSpider, self).__init__(*args, **kwargs)
+        # Articles already requested by any search term or page, so that
+        # overlapping terms ("банк"/"банки") spend their budget on new links
+        self.requested_urls = set()
+
     def start_requests(self):
         search_terms = ['банк', 'финансы', 'кредит', 'банки']
 
@@ -22,56 +88,46 @@ class CnewsSpider(scrapy.Spider):
             yield scrapy.Request(
                 url=search_url,
                 callback=self.parse_search_results,
-                meta={'search_term': term, 'page': 1}
+                cb_kwargs={'search_term': term, 'page': 1}
             )
 
-    def parse_search_results(self, response):
-        search_term = response.meta['search_term']
-        page = response.meta['page']
-
+    def parse_search_results(self, response, search_term, page):
         self.logger.info(f"Parsing search results for '{search_term}' - page {page}")
 
         # Method 1: Extract proper article links using CSS selectors
+        # (links are kept in the order they are first seen, skipping
+        # articles another search already requested)
         article_links = []
+        seen = set()
 
         # Look for links in search result items with proper structure
-        search_items = response.css('.search-results a, .news-item a, .article-item a, a[href*="/news/"], a[href*="/articles/"]')
-
-        for link in search_items:
-            href = link.css('::attr(href)').get()
+        for href in self._SEARCH_HREF_XPATH(response.selector.root):
             if href:
                 # Clean and validate the URL
                 clean_url = self.clean_url(href)
-                if clean_url and self.is_valid_article_url(clean_url):
+                if (clean_url and clean_url not in seen and clean_url not in self.requested_urls and
+                        self.is_valid_article_url(clean_url)):
+                    seen.add(clean_url)
                     article_links.append(clean_url)
 
         # Method 2: Extract from page text using regex (fallback)
-        page_text = response.text
-        # Look for URLs in the format /news/date_article_name or /articles/date_article_name
-        url_patterns = [
-            r'href=["\'](/news/\d{4}-\d{2}-\d{2}_[^"\'\s>]+)["\']',
-            r'href=["\'](/articles/\d{4}-\d{2}-\d{2}_[^"\'\s>]+)["\']',
-            r'href=["\'](/line/\d{4}-\d{2}-\d{2}_[^"\'\s>]+)["\']',
-        ]
-
-        for pattern in url_patterns:
-            matches = re.findall(pattern, page_text)
-            for match in matches:
-                clean_url = self.clean_url(match)
-                if clean_url and clean_url not in article_links:
+        # Only needed when the CSS links don't already fill the page budget
+        if len(article_links) < self._ARTICLES_PER_PAGE:
+            for match in _HREF_RE.finditer(response.text):
+                clean_url = self.clean_url(match.group(1))
+                if clean_url and clean_url not in seen and clean_url not in self.requested_urls:
+                    seen.add(clean_url)
                     article_links.append(clean_url)
 
-        # Remove duplicates
-        article_links = list(set(article_links))
-
-        self.logger.info(f"Found {len(article_links)} valid article links")
+        self.logger.info(f"Found {len(article_links)} new valid article links")
 
         # Follow article links
-        for article_url in article_links[:10]:  # Limit to first 10 articles per page
+        for article_url in article_links[:self._ARTICLES_PER_PAGE]:
+            self.requested_urls.add(article_url)
             yield scrapy.Request(
                 url=article_url,
                 callback=self.parse_article,
-                meta={'search_term': search_term}
+                cb_kwargs={'search_term': search_term}
             )
 
         # Follow next page if exists
@@ -81,11 +137,11 @@ class CnewsSpider(scrapy.Spider):
                 next_page = response.xpath('//a[contains(text(), "Далее") or contains(text(), "Next")]/@href').get()
 
             if next_page:
-                next_url = urljoin('https://www.cnews.ru', next_page)
+                next_url = urljoin(_BASE_URL, next_page)
                 yield scrapy.Request(
                     url=next_url,
                     callback=self.parse_search_results,
-                    meta={'search_term': search_term, 'page': page + 1}
+                    cb_kwargs={'search_term': search_term, 'page': page + 1}
                 )
 
     def clean_url(self, url):
@@ -93,60 +149,53 @@ class CnewsSpider(scrapy.Spider):
         if not url:
             return None
 
-        # Remove HTML entities and malformed content
-        url = re.sub(r'%3Ca.*?href=%22', '', url)
-        url = re.sub(r'%22.*%3E.*%3C/a%3E', '', url)
-        url = re.sub(r'&amp;', '&', url)
+        # Remove HTML entities and malformed content - the wrapped-anchor
+        # cleanup can only apply when an encoded '<' or '"' is present
+        malformed = '%3C' in url or '%22' in url
+        if malformed:
+            url = _MALFORMED_HREF_RE.sub('', url)
+            url = _MALFORMED_TAIL_RE.sub('', url)
+        url = url.replace('&amp;', '&')
 
         # Handle relative URLs
         if url.startswith('//'):
             url = 'https:' + url
         elif url.startswith('/'):
-            url = urljoin('https://www.cnews.ru', url)
+            url = _BASE_URL + url
         elif not url.startswith('http'):
-            url = urljoin('https://www.cnews.ru', url)
+            url = urljoin(_BASE_URL, url)
 
         # Remove any remaining malformed parts
-        if '%3C' in url or '%22' in url:
+        if malformed and ('%3C' in url or '%22' in url):
             return None
 
         return url
 
     def is_valid_article_url(self, url):
         """Check if URL is a valid article URL"""
-        if not url.startswith('https://www.cnews.ru/'):
-            return False
-
-        valid_patterns = [
-            '/news/',
-            '/articles/',
-            '/line/'
-        ]
-
-        return any(pattern in url for pattern in valid_patterns)
-
-    def parse_article(self, response):
-        search_term = response.meta['search_term']
+        return _VALID_ARTICLE_RE.match(url) is not None
 
-        # Extract title
-        title = (response.css('h1::text').get() or
-                response.css('.article-title::text').get() or
-                response.css('title::text').get() or
-                "").strip()
+    def parse_article(self, response, search_term):
+        # Extract title - first selector with text wins
+        title = None
+        for xpath in self._TITLE_XPATHS:
+            title = _first(xpath, response.selector.root)
+            if title:
+                break
+        title = (title or "").strip()
 
         # Clean title
-        if ' - CNews.ru' in title:
-            title = title.split(' - CNews.ru')[0].strip()
+        title = title.removesuffix(' - CNews.ru').strip()
 
         # Extract description
         description = self.extract_description(response)
 
-        yield {
-            'title': title,
-            'url': response.url,
-            'search_term': search_term,
-            'description': description,
-        }
+        yield ScrapyBankcnewsItem(
+            title=title,
+            url=response.url,
+            search_term=search_term,
+            description=description,
+        )
 
     def extract_description(self, response):
         """Extract article description using multiple methods"""
@@ -162,14 +211,14 @@ class CnewsSpider(scrapy.Spider):
             return og_desc.strip()
 
         # Method 3: Extract from article content
-        article_content = response.css('.news_container p::text, article p::text, .article-content p::text').getall()
+        # Plain strings straight from lxml, no Selector per text node
+        article_content = self._CONTENT_TEXT_XPATH(response.selector.root)
 
         if article_content:
             description_parts = []
             for p in article_content:
                 text = p.strip()
-                if (len(text) > 50 and
-                    not any(word in text.lower() for word in ['реклама', 'advertisement', 'читать также'])):
+                if len(text) > 50 and not _AD_RE.search(text):
                     description_parts.append(text)
                     if len(description_parts) >= 2:
                         break